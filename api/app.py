@@ -4,20 +4,27 @@ from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 # Import Pydantic for data validation and settings management
 from pydantic import BaseModel
-# Import OpenAI client for interacting with OpenAI's API
-from openai import OpenAI
+# Import the async OpenAI client so streaming never blocks the event loop
+from openai import AsyncOpenAI
 import os
+from functools import lru_cache
 from typing import Optional
 
 # Initialize FastAPI application with a title
 app = FastAPI(title="OpenAI Chat API")
 
 # Configure CORS (Cross-Origin Resource Sharing) middleware
-# This allows the API to be accessed from different domains/origins
+# This allows the API to be accessed from different domains/origins.
+# Set FRONTEND_ORIGIN (comma-separated) to restrict access; defaults to any origin.
+allowed_origins = [
+    origin.strip()
+    for origin in os.environ.get("FRONTEND_ORIGIN", "*").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allows requests from any origin
-    allow_credentials=True,  # Allows cookies to be included in requests
+    allow_origins=allowed_origins,  # Origins allowed to call the API
+    allow_credentials=False,  # No cookies are used; the API key travels in the body
     allow_methods=["*"],  # Allows all HTTP methods (GET, POST, etc.)
     allow_headers=["*"],  # Allows all headers in requests
 )
@@ -30,17 +37,25 @@ class ChatRequest(BaseModel):
     model: Optional[str] = "gpt-4.1-mini"  # Optional model selection with default
     api_key: str          # OpenAI API key for authentication
 
+# Reuse one async OpenAI client per API key so its HTTP connection pool
+# (and TLS sessions) survive across requests. The LRU cap keeps memory
+# bounded when many different keys pass through the server.
+@lru_cache(maxsize=128)
+def _get_async_client(api_key: str) -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=api_key)
+
 # Define the main chat endpoint that handles POST requests
 @app.post("/api/chat")
 async def chat(request: ChatRequest):
     try:
-        # Initialize OpenAI client with the provided API key
-        client = OpenAI(api_key=request.api_key)
+        # Get the (cached) async OpenAI client for the provided API key
+        client = _get_async_client(request.api_key)
         
         # Create an async generator function for streaming responses
         async def generate():
-            # Create a streaming chat completion request
-            stream = client.chat.completions.create(
+            # Create a streaming chat completion request (awaited, so the
+            # event loop can serve other requests while we wait on OpenAI)
+            stream = await client.chat.completions.create(
                 model=request.model,
                 messages=[
                     {"role": "developer", "content": request.developer_message},
@@ -50,9 +65,11 @@ async def chat(request: ChatRequest):
             )
             
             # Yield each chunk of the response as it becomes available
-            for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    yield chunk.choices[0].delta.content
+            async for chunk in stream:
+                content = chunk.choices[0].delta.content
+                # Skip None/empty deltas so we don't write empty body chunks
+                if content:
+                    yield content
 
         # Return a streaming response to the client
         return StreamingResponse(generate(), media_type="text/plain")